@@ -24,8 +24,51 @@ import warnings
 from ._units import convert_units
 
 
+def _length(value):
+    """
+    Convert a length argument to a float.
+
+    Numbers, including numpy scalars and size-1 arrays, are accepted.
+    Strings and arrays with more than one element are rejected with
+    a TypeError.
+
+    """
+    if type(value) is float or type(value) is int:
+        return float(value)
+    if isinstance(value, (str, bytes)):
+        raise TypeError('lengths must be single numbers, '
+                        'not {!r}'.format(value))
+    if getattr(value, 'ndim', 0):
+        if value.size != 1:
+            raise TypeError('lengths must be single numbers, '
+                            'not {!r}'.format(value))
+        value = value.item()
+    return float(value)
+
+
 class PanelSizeLocator(object):
-    """A panel locator based on panel size."""
+    """
+    A panel locator based on panel size.
+
+    Locators are immutable: the figure size and panel positions are
+    computed on construction and are not updated if attributes change.
+
+    """
+
+    # Every attribute set in __init__ must be listed here, new cached
+    # values need adding to the last group:
+    __slots__ = (
+        # Layout specification:
+        'rows', 'columns', 'panelwidth', 'panelheight', 'hsep', 'vsep',
+        'padleft', 'padright', 'padtop', 'padbottom', 'units',
+        # Derived figure and panel sizes:
+        'figwidth', 'figheight', 'panelwidth_fig', 'panelheight_fig',
+        # Values cached in __init__ for fast panel position lookups:
+        '_inv_figw', '_inv_figh', '_xpitch', '_ypitch', '_y0',
+        '_xs', '_ys', '_figsize_inches', '_panel_positions',
+        # Locators can be weakly referenced:
+        '__weakref__',
+    )
 
     def __init__(self, rows, columns, panelwidth, panelheight,
                  hsep=0, vsep=0, padleft=0, padright=0, padtop=0,
@@ -75,26 +118,58 @@ class PanelSizeLocator(object):
 
         """
         self.rows, self.columns = rows, columns
-        self.panelwidth = panelwidth
-        self.panelheight = panelheight
-        self.hsep = hsep
-        self.vsep = vsep
-        self.padleft = padleft
-        self.padright = padright
-        self.padtop = padtop
-        self.padbottom = padbottom
+        # Lengths may be given as numpy scalars or 0-d arrays, store them
+        # as plain floats so the layout arithmetic stays in Python floats:
+        self.panelwidth = _length(panelwidth)
+        self.panelheight = _length(panelheight)
+        self.hsep = _length(hsep)
+        self.vsep = _length(vsep)
+        self.padleft = _length(padleft)
+        self.padright = _length(padright)
+        self.padtop = _length(padtop)
+        self.padbottom = _length(padbottom)
         self.units = units
         self.figwidth = (self.padleft + self.columns * self.panelwidth +
                          (self.columns - 1) * self.hsep + self.padright)
         self.figheight = (self.padtop + self.rows * self.panelheight +
                           (self.rows - 1) * self.vsep + self.padbottom)
-        self.panelwidth_fig = self.panelwidth / self.figwidth
-        self.panelheight_fig = self.panelheight / self.figheight
+        # Normalizing to figure coordinates is a multiply by the
+        # reciprocal figure dimensions:
+        self._inv_figw = 1. / self.figwidth
+        self._inv_figh = 1. / self.figheight
+        self.panelwidth_fig = self.panelwidth * self._inv_figw
+        self.panelheight_fig = self.panelheight * self._inv_figh
+        # Separations are uniform, so the offset of a panel from the
+        # first row/column is a single multiply of the pitch between
+        # panels:
+        self._xpitch = self.panelwidth + self.hsep
+        self._ypitch = self.panelheight + self.vsep
+        self._y0 = self.figheight - self.padtop - self.panelheight
+        # The position of a panel is separable into a column-dependent x
+        # and a row-dependent y, so memoize these once per locator and
+        # turn panel position lookups into two list reads:
+        self._xs = [self._panel_x(column) for column in range(self.columns)]
+        self._ys = [self._panel_y(row) for row in range(self.rows)]
+        # The figure size in inches is what matplotlib needs, compute it
+        # once rather than converting on every access:
+        self._figsize_inches = self.figsize_in('inches')
+        self._panel_positions = {}
+
+    def __getstate__(self):
+        # Slotted instances have no __dict__, so pickle the slot values
+        # explicitly (required for pickle protocols 0 and 1):
+        return dict((name, getattr(self, name))
+                    for name in PanelSizeLocator.__slots__
+                    if name != '__weakref__')
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
 
     @property
     def figsize(self):
         """The figure size (width, height) in inches."""
-        return self.figsize_in('inches')
+        return self._figsize_inches
 
     def figsize_in(self, units):
         """
@@ -122,14 +197,37 @@ class PanelSizeLocator(object):
             "column" for column-major order (rows then columns).
 
         """
-        row_gen = range(self.rows)
-        col_gen = range(self.columns)
+        w, h = self.panelwidth_fig, self.panelheight_fig
+        # Iterate directly over the precomputed panel coordinates rather
+        # than looking up each panel position in turn:
+        if order == 'row':
+            return ((x, y, w, h) for y, x in product(self._ys, self._xs))
+        elif order == 'column':
+            return ((x, y, w, h) for x, y in product(self._xs, self._ys))
+        raise ValueError('the order keyword must be either "row" or "column"')
+
+    def panel_positions(self, order='row'):
+        """
+        Returns a tuple of panel positions.
+
+        The tuple is computed on first use for each order and reused
+        for subsequent calls, making it suitable for iterating over the
+        panels more than once.
+
+        Keyword argument:
+
+        * order (default='row'): str
+            The order in which panels are listed. Accepted values are
+            "row" for row-major order (columns then rows), or "column"
+            for column-major order (rows then columns).
+
+        """
         try:
-            i0, i1, g0, g1 = {'row': (0, 1, row_gen, col_gen),
-                              'column': (1, 0, col_gen, row_gen)}[order]
+            positions = self._panel_positions[order]
         except KeyError:
-            raise ValueError('the order keyword must be either "row" or "column"')
-        return (self.panel_position(x[i0], x[i1]) for x in product(g0, g1))
+            positions = tuple(self.panel_position_iterator(order=order))
+            self._panel_positions[order] = positions
+        return positions
 
     def panel_position(self, row, column):
         """
@@ -140,15 +238,31 @@ class PanelSizeLocator(object):
 
         row, column: integer
            The row and column indices of the panel, where indices start at
-           0 in the top-left.
+           0 in the top-left. Indices outside the grid (including negative
+           indices) are not wrapped, they give the position the panel
+           would have if the grid were extended, which lies outside the
+           figure.
 
         """
-        x = self.padleft + (self.panelwidth + self.hsep) * column
-        y = (self.figheight - self.padtop -
-             self.panelheight * (row + 1) - self.vsep * row)
-        x_fig = x / self.figwidth
-        y_fig = y / self.figheight
-        return (x_fig, y_fig, self.panelwidth_fig, self.panelheight_fig)
+        # Read positions within the grid from the coordinate tables and
+        # compute anything else from the layout:
+        if type(column) is int and 0 <= column < self.columns:
+            x = self._xs[column]
+        else:
+            x = self._panel_x(column)
+        if type(row) is int and 0 <= row < self.rows:
+            y = self._ys[row]
+        else:
+            y = self._panel_y(row)
+        return (x, y, self.panelwidth_fig, self.panelheight_fig)
+
+    def _panel_x(self, column):
+        """The x position of a column of panels in figure coordinates."""
+        return (self.padleft + self._xpitch * column) * self._inv_figw
+
+    def _panel_y(self, row):
+        """The y position of a row of panels in figure coordinates."""
+        return (self._y0 - self._ypitch * row) * self._inv_figh
 
     def span_panel_position(self, row1, column1, row2, column2):
         """
@@ -161,25 +275,40 @@ class PanelSizeLocator(object):
         row1, column1, row2, column2: integer
            The row and column indices of the two panels, where indices
            start at 0 in the top-left. The returned panel position will
-           span the full extent of both panels.
+           span the full extent of both panels. Indices outside the grid
+           are treated as in `panel_position`.
 
         """
-        x1 = self.padleft + (self.panelwidth + self.hsep) * column1
-        x2 = self.padleft + (self.panelwidth + self.hsep) * column2
-        y1 = (self.figheight - self.padtop -
-              self.panelheight * (row1 + 1) - self.vsep * row1)
-        y2 = (self.figheight - self.padtop -
-              self.panelheight * (row2 + 1) - self.vsep * row2)
-        x_fig = min(x1, x2) / self.figwidth
-        y_fig = min(y1, y2) / self.figheight
-        width_fig = max(x1, x2) / self.figwidth + self.panelwidth_fig - x_fig
-        height_fig = max(y1, y2) / self.figheight + self.panelheight_fig - y_fig
+        xs, ys = self._xs, self._ys
+        ncols, nrows = self.columns, self.rows
+        if type(column1) is int and 0 <= column1 < ncols:
+            x1 = xs[column1]
+        else:
+            x1 = self._panel_x(column1)
+        if type(column2) is int and 0 <= column2 < ncols:
+            x2 = xs[column2]
+        else:
+            x2 = self._panel_x(column2)
+        if type(row1) is int and 0 <= row1 < nrows:
+            y1 = ys[row1]
+        else:
+            y1 = self._panel_y(row1)
+        if type(row2) is int and 0 <= row2 < nrows:
+            y2 = ys[row2]
+        else:
+            y2 = self._panel_y(row2)
+        x_fig = min(x1, x2)
+        y_fig = min(y1, y2)
+        width_fig = max(x1, x2) + self.panelwidth_fig - x_fig
+        height_fig = max(y1, y2) + self.panelheight_fig - y_fig
         return (x_fig, y_fig, width_fig, height_fig)
 
 
 class FigureSizeLocator(PanelSizeLocator):
     """A panel locator based on total figure size."""
 
+    __slots__ = ()
+
     def __init__(self, rows, columns, figwidth=None, figheight=None,
                  panelratio=None, hsep=0, vsep=0, padleft=0, padright=0,
                  padtop=0, padbottom=0, units='mm'):
@@ -304,6 +433,13 @@ class FigureSizeLocator(PanelSizeLocator):
         if figwidth is None and figheight is None:
             raise ValueError('one or both of the "figwidth" and "figheight" '
                              'keywords must be used')
+        if figwidth is not None:
+            figwidth = _length(figwidth)
+        if figheight is not None:
+            figheight = _length(figheight)
+        hsep, vsep = _length(hsep), _length(vsep)
+        padleft, padright = _length(padleft), _length(padright)
+        padtop, padbottom = _length(padtop), _length(padbottom)
         if figwidth is not None and figheight is not None:
             # Both width and height are prescribed, choose the panel size
             # appropriately (ignoring any specified aspect ratio):
@@ -315,10 +451,10 @@ class FigureSizeLocator(PanelSizeLocator):
                           padright) / float(columns)
             panelheight = (figheight - (rows - 1) * vsep - padtop -
                            padbottom) / float(rows)
-            if panelwidth <=0 or panelheight <= 0:
-                msg = ('the specified dimensions are not large enough to'
-                       'locate panels with the desired separation and padding')
-                raise ValueError(msg)
+            if panelwidth <= 0 or panelheight <= 0:
+                raise ValueError('the specified dimensions are not large '
+                                 'enough to locate panels with the desired '
+                                 'separation and padding')
         elif figwidth is None:
             # Only the figure height is prescribed, choose the panel height
             # appropriately and determine the panel width from the aspect
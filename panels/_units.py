@@ -45,15 +45,7 @@ def convert_units(quantity, source_units, target_units):
     target_units = _normalize_units(target_units)
     if source_units == target_units:
         return quantity
-    try:
-        converters_from_source_units = _CONVERSIONS[source_units]
-    except KeyError:
-        raise
-    try:
-        converter = converters_from_source_units[target_units]
-    except KeyError:
-        raise
-    return converter(quantity)
+    return quantity * _FACTORS[source_units][target_units]
 
 
 def _normalize_units(units):
@@ -78,12 +70,12 @@ def _normalize_units(units):
     return normed
 
 
-#: Conversion functions to go between the three units of length.
-_CONVERSIONS = {
-    'mm': {'cm': lambda mm: mm / 10,
-           'inches': lambda mm: mm / 25.4},
-    'cm': {'mm': lambda cm: cm * 10,
-           'inches': lambda cm: (cm * 10) / 25.4},
-    'inches': {'mm': lambda inches: inches * 25.4,
-               'cm': lambda inches: inches * 25.4 / 10},
+#: Multiplicative factors to go between the three units of length.
+_FACTORS = {
+    'mm': {'cm': 1 / 10,
+           'inches': 1 / 25.4},
+    'cm': {'mm': 10.,
+           'inches': 10 / 25.4},
+    'inches': {'mm': 25.4,
+               'cm': 25.4 / 10},
 }
@@ -520,7 +520,7 @@ def test_full_spec_ill_conditioned(rows, columns, figwidth, figheight, hsep,
                               figheight=figheight, hsep=hsep, vsep=vsep,
                               padleft=padleft, padright=padright,
                               padtop=padtop, padbottom=padbottom, units=units)
-    assert 'not large enough' in str(excinfo.value)
+    assert 'not large enough to locate panels' in str(excinfo.value)
 
 
 @given(rows=gridsize_st, columns=gridsize_st, figwidth=length_st,
@@ -547,3 +547,21 @@ def test_height_spec_ill_conditioned(rows, columns, figheight, vsep, padtop,
         l = FigureSizeLocator(rows, columns, figheight=figheight, vsep=vsep,
                               padtop=padtop, padbottom=padbottom, units=units)
     assert 'not tall enough' in str(excinfo.value)
+
+
+#-----------------------------------------------------------------------
+# Tests for length argument types.
+#-----------------------------------------------------------------------
+
+def test_panel_size_lengths():
+    """Figure dimensions are converted and validated like other lengths."""
+    np = pytest.importorskip('numpy')
+    panelwidth, panelheight = FigureSizeLocator.panel_size(
+        2, 3, figwidth=np.float64(36), figheight=np.array([20.]), hsep=3)
+    assert type(panelwidth) is float and type(panelheight) is float
+    assert almost_equal(panelwidth, 10)
+    assert almost_equal(panelheight, 10)
+    with pytest.raises(TypeError):
+        FigureSizeLocator.panel_size(2, 3, figwidth=np.array([1., 2.]))
+    with pytest.raises(TypeError):
+        FigureSizeLocator.panel_size(2, 3, figheight='5')
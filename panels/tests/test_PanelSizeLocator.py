@@ -18,6 +18,9 @@
 
 from __future__ import (absolute_import, division, print_function)
 
+import pickle
+import weakref
+
 from hypothesis import given
 import pytest
 
@@ -103,6 +106,31 @@ def test_with_hsep_and_vsep(rows, columns, panelwidth, panelheight,
     check_panels_in_figure(l)
 
 
+def test_numpy_scalar_lengths():
+    """Numpy scalars and size-1 arrays are accepted and stored as floats."""
+    np = pytest.importorskip('numpy')
+    l = PanelSizeLocator(2, 3, np.float64(10), 10, hsep=np.array(2.),
+                         vsep=np.array([1.]), padleft=np.int64(3))
+    for value in (l.panelwidth, l.hsep, l.vsep, l.padleft):
+        assert type(value) is float
+    assert l.figsize_in('mm') == (37., 21.)
+
+
+@pytest.mark.parametrize("name", ['hsep', 'vsep', 'padleft', 'padtop'])
+def test_array_lengths(name):
+    """Arrays of more than one length are rejected."""
+    np = pytest.importorskip('numpy')
+    with pytest.raises(TypeError):
+        PanelSizeLocator(3, 3, 1, 1, **{name: np.array([1., 2.])})
+
+
+@pytest.mark.parametrize("name", ['hsep', 'vsep', 'padleft', 'padtop'])
+def test_string_lengths(name):
+    """Strings are not accepted as lengths."""
+    with pytest.raises(TypeError):
+        PanelSizeLocator(3, 3, 1, 1, **{name: '5'})
+
+
 #-----------------------------------------------------------------------
 # Tests with padding.
 #-----------------------------------------------------------------------
@@ -223,3 +251,113 @@ def test_iterate_column_major(rows, columns):
     for n, pp in enumerate(l.panel_position_iterator(order='column')):
         assert almost_equal((n // rows) * dx, pp[0])
         assert almost_equal(1 - (n % rows + 1) * dy, pp[1])
+
+
+@pytest.mark.parametrize("order", ['row', 'column'])
+@given(rows=gridsize_st, columns=gridsize_st)
+def test_panel_positions(rows, columns, order):
+    l = PanelSizeLocator(rows, columns, 1, 1)
+    positions = l.panel_positions(order=order)
+    assert positions == tuple(l.panel_position_iterator(order=order))
+    assert l.panel_positions(order=order) is positions
+
+
+def test_iterate_invalid_order():
+    l = PanelSizeLocator(2, 3, 1, 1)
+    with pytest.raises(ValueError):
+        l.panel_position_iterator(order='diagonal')
+    with pytest.raises(ValueError):
+        l.panel_positions(order='diagonal')
+
+
+#-----------------------------------------------------------------------
+# Tests for positions of individual panels.
+#-----------------------------------------------------------------------
+
+def test_panel_position_outside_grid():
+    """Indices outside the grid extend the grid rather than wrapping."""
+    l = PanelSizeLocator(2, 3, 1, 1)
+    x, y, w, h = l.panel_position(-1, -1)
+    assert almost_equal(-x, 1. / 3)
+    assert almost_equal(y, 1)
+    x, y, w, h = l.panel_position(2, 3)
+    assert almost_equal(x, 1)
+    assert almost_equal(-y, 0.5)
+    assert almost_equal(w, 1. / 3)
+    assert almost_equal(h, 0.5)
+
+
+def test_panel_position_non_integer():
+    """Non-integer indices are interpolated between grid positions."""
+    l = PanelSizeLocator(2, 3, 1, 1)
+    x, y, _, _ = l.panel_position(0.5, 1)
+    assert almost_equal(x, 1. / 3)
+    assert almost_equal(y, 0.25)
+
+
+#-----------------------------------------------------------------------
+# Tests for panels spanning multiple grid cells.
+#-----------------------------------------------------------------------
+
+@given(rows=gridsize_st, columns=gridsize_st, panelwidth=length_st,
+       panelheight=length_st, hsep=offset_st, vsep=offset_st)
+def test_span_single_panel(rows, columns, panelwidth, panelheight,
+                           hsep, vsep):
+    """A span from a panel to itself is the position of that panel."""
+    l = PanelSizeLocator(rows, columns, panelwidth, panelheight,
+                         hsep=hsep, vsep=vsep)
+    row, column = rows - 1, columns - 1
+    span = l.span_panel_position(row, column, row, column)
+    for a, b in zip(span, l.panel_position(row, column)):
+        assert almost_equal(a, b)
+
+
+@given(rows=gridsize_st, columns=gridsize_st)
+def test_span_full_grid(rows, columns):
+    """A span between opposite corners covers the whole figure."""
+    l = PanelSizeLocator(rows, columns, 1, 1)
+    for span in (l.span_panel_position(0, 0, rows - 1, columns - 1),
+                 l.span_panel_position(rows - 1, columns - 1, 0, 0)):
+        x, y, w, h = span
+        assert almost_equal(x, 0)
+        assert almost_equal(y, 0)
+        assert almost_equal(w, 1)
+        assert almost_equal(h, 1)
+
+
+def test_span_outside_grid():
+    """Spans to indices outside the grid extend the grid."""
+    l = PanelSizeLocator(2, 3, 1, 1)
+    x, y, w, h = l.span_panel_position(-1, -1, 0, 0)
+    assert almost_equal(-x, 1. / 3)
+    assert almost_equal(y, 0.5)
+    assert almost_equal(w, 2. / 3)
+    assert almost_equal(h, 1)
+    x, y, w, h = l.span_panel_position(0.5, 0, 0.5, 1.5)
+    assert almost_equal(x, 0)
+    assert almost_equal(y, 0.25)
+    assert almost_equal(w, 5. / 6)
+    assert almost_equal(h, 0.5)
+
+
+#-----------------------------------------------------------------------
+# Tests for locator objects.
+#-----------------------------------------------------------------------
+
+def test_weakref():
+    """Locators can be weakly referenced."""
+    l = PanelSizeLocator(2, 3, 10, 10)
+    assert weakref.ref(l)() is l
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol):
+    """Locators survive a pickle round-trip with any protocol."""
+    l = PanelSizeLocator(2, 3, 10, 10, hsep=2, vsep=1, units='cm')
+    l.panel_positions()
+    p = pickle.loads(pickle.dumps(l, protocol))
+    assert type(p) is PanelSizeLocator
+    assert p.units == 'cm'
+    assert p.figsize == l.figsize
+    assert p.panel_positions() == l.panel_positions()
+    assert p.panel_position(1, 2) == l.panel_position(1, 2)